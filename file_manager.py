@@ -6,13 +6,82 @@ compresses them using gzip, and removes the originals.
 """
 
 import argparse
+import fnmatch
+import functools
 import gzip
+import hashlib
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import re
 import shutil
+import tarfile
+import threading
 import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from types import ModuleType
+from typing import BinaryIO
+
+# Optional accelerated gzip implementations. Both produce standard .gz
+# output and mirror the stdlib gzip API, so they are drop-in replacements.
+try:
+    from isal import igzip as isal_gzip
+except ImportError:
+    isal_gzip = None
+
+try:
+    from zlib_ng import gzip_ng
+except ImportError:
+    gzip_ng = None
+
+# Selectable gzip backends, in order of preference for "auto".
+COMPRESSORS = ("isal", "zlibng", "stdlib")
+
+# Extensions of formats that are already compressed; gzipping them again
+# burns CPU for no gain and usually makes them slightly larger.
+INCOMPRESSIBLE = frozenset({
+    ".gz", ".tgz", ".bz2", ".xz", ".lz4", ".zst", ".zip", ".7z", ".rar",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".mp3", ".mp4", ".mkv", ".webm",
+})
+
+# Glob patterns follow the platform's file name case sensitivity.
+_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# Files smaller than this are never treated as transparently compressed by
+# the filesystem; see _appears_compressed_on_disk.
+FS_COMPRESSED_MIN_SIZE = 64 * 1024
+
+# Chunk and I/O buffer size used when compressing (1 MiB).
+COPY_BUFSIZE = 1 << 20
+
+# Number of chunk buffers cycled between the reader thread and the
+# compressor in _copy_to_gzip; bounds how far reads run ahead.
+PIPELINE_DEPTH = 4
+
+# Number of files handed to a pool worker at a time by manage_files.
+PARALLEL_BATCH = 8
+
+# Name of an output file still being written: "<final name>.tmp-<pid>",
+# where the final name ends in .gz. See _temp_path.
+_TEMP_NAME = re.compile(r"\.gz\.tmp-(\d+)$")
+
+# Per-thread state; holds the reusable chunk buffers (see _chunk_buffers).
+_thread_local = threading.local()
 
 
 class CompressResult(Enum):
@@ -23,7 +92,7 @@ class CompressResult(Enum):
     IN_USE = "in_use"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingStats:
     """Statistics from file processing."""
 
@@ -35,6 +104,20 @@ class ProcessingStats:
     bytes_saved: int = 0
     errors: list[str] = field(default_factory=list)
 
+    def merge(self, other: "ProcessingStats") -> None:
+        """Add another set of statistics into this one.
+
+        Args:
+            other: Statistics to fold in; left unchanged.
+        """
+        self.files_scanned += other.files_scanned
+        self.files_compressed += other.files_compressed
+        self.files_skipped += other.files_skipped
+        self.files_failed += other.files_failed
+        self.files_in_use += other.files_in_use
+        self.bytes_saved += other.bytes_saved
+        self.errors.extend(other.errors)
+
     def __str__(self) -> str:
         return (
             f"Scanned: {self.files_scanned}, "
@@ -66,8 +149,256 @@ def setup_logging(log_file: str | None = None, verbose: bool = False) -> None:
     )
 
 
+def available_compressors() -> list[str]:
+    """Return the names of the gzip backends importable in this environment."""
+    modules = {"isal": isal_gzip, "zlibng": gzip_ng, "stdlib": gzip}
+    return [name for name in COMPRESSORS if modules[name] is not None]
+
+
+def resolve_compressor(compressor: str) -> str:
+    """Resolve "auto" to the fastest installed gzip backend.
+
+    Args:
+        compressor: One of COMPRESSORS, or "auto".
+
+    Returns:
+        The concrete backend name.
+    """
+    if compressor == "auto":
+        return available_compressors()[0]
+    return compressor
+
+
+def backend_level(compressor: str, compresslevel: int) -> int:
+    """Translate a gzip compression level to the level a backend runs at.
+
+    ISA-L only implements levels 0-3, so gzip's 1-9 are spread across them:
+    1-2, 3-4, 5-6 and 7-9 become 0, 1, 2 and 3. Other backends take gzip's
+    levels as they are.
+
+    Args:
+        compressor: One of COMPRESSORS, or "auto".
+        compresslevel: gzip compression level (1=fastest, 9=best).
+
+    Returns:
+        The level passed to the backend.
+    """
+    if resolve_compressor(compressor) == "isal":
+        return min(3, (compresslevel - 1) // 2)
+    return compresslevel
+
+
+def _gzip_backend(compressor: str) -> ModuleType:
+    """Return the gzip module for a compressor name.
+
+    Raises:
+        ValueError: If the compressor is unknown or not installed.
+    """
+    compressor = resolve_compressor(compressor)
+    if compressor == "isal" and isal_gzip is not None:
+        return isal_gzip
+    if compressor == "zlibng" and gzip_ng is not None:
+        return gzip_ng
+    if compressor == "stdlib":
+        return gzip
+    raise ValueError(f"gzip backend not available: {compressor}")
+
+
+def _open_gzip(
+    raw_out: BinaryIO,
+    name: str,
+    mtime: float,
+    compresslevel: int,
+    compressor: str,
+) -> BinaryIO:
+    """Open a gzip writer on top of an already-open binary file.
+
+    The header's name and timestamp are set explicitly rather than taken
+    from raw_out, which may be a temporary file, so `gunzip -N` restores
+    the original name and modification time.
+
+    Args:
+        raw_out: Binary file the compressed stream is written to.
+        name: Final file name of the .gz; the header records it without
+            the .gz suffix.
+        mtime: Modification time to record in the header. Times the
+            header cannot hold are recorded as 0 (no timestamp).
+        compresslevel: gzip compression level (1=fastest, 9=best).
+        compressor: gzip backend to use; see COMPRESSORS.
+
+    Returns:
+        A writable gzip file object. Closing it does not close raw_out.
+    """
+    # MTIME is an unsigned 32-bit field; like GNU gzip, leave it unset
+    # rather than fail on a file dated before 1970 or after 2106.
+    if not 0 <= mtime < 2**32:
+        mtime = 0
+    gzip_module = _gzip_backend(compressor)
+    if gzip_module is isal_gzip:
+        compresslevel = backend_level("isal", compresslevel)
+        gzip_file = isal_gzip.IGzipFile
+    elif gzip_module is gzip_ng:
+        gzip_file = gzip_ng.GzipNGFile
+    else:
+        gzip_file = gzip.GzipFile
+    return gzip_file(
+        filename=name,
+        mode="wb",
+        compresslevel=compresslevel,
+        fileobj=raw_out,
+        mtime=mtime,
+    )
+
+
+def _temp_path(path: Path) -> Path:
+    """Return the name path is written under until it is complete.
+
+    The name does not end in .gz, so a leftover from a crashed run is never
+    mistaken for a finished archive by anything globbing for *.gz. It does
+    match _TEMP_NAME, so manage_files never compresses it and removes it
+    once the process that wrote it has exited.
+    """
+    return path.with_name(f"{path.name}.tmp-{os.getpid()}")
+
+
+def _remove_stale_temp(entry: os.DirEntry, dry_run: bool = False) -> None:
+    """Remove a leftover temporary output file if its writer is gone.
+
+    Args:
+        entry: Directory entry whose name matches _TEMP_NAME.
+        dry_run: If True, only report what would be removed.
+    """
+    pid = int(_TEMP_NAME.search(entry.name)[1])
+    # Signal 0 only probes for the process on POSIX; elsewhere os.kill
+    # would terminate it, so leftovers there are left alone.
+    if os.name != "posix" or pid == os.getpid():
+        return
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        pass  # the writer has exited
+    except OSError:
+        return  # e.g. EPERM: alive, but owned by another user
+    else:
+        return  # still being written
+
+    if dry_run:
+        logging.info(f"[DRY-RUN] Would remove stale temporary file: {entry.path}")
+        return
+    try:
+        os.unlink(entry.path)
+    except OSError as e:
+        logging.warning(f"Cannot remove stale temporary file {entry.path}: {e}")
+        return
+    logging.info(f"Removed stale temporary file: {entry.path}")
+
+
+def _chunk_buffers() -> list[bytearray]:
+    """Return this thread's chunk buffers, allocating them on first use.
+
+    The buffers survive across files, so a worker process reuses the same
+    few allocations for every file it compresses.
+    """
+    bufs = getattr(_thread_local, "chunk_buffers", None)
+    if bufs is None:
+        bufs = _thread_local.chunk_buffers = [
+            bytearray(COPY_BUFSIZE) for _ in range(PIPELINE_DEPTH)
+        ]
+    return bufs
+
+
+def _fadvise(f: BinaryIO, advice: str) -> None:
+    """Give the kernel a best-effort page cache hint for the whole file.
+
+    Args:
+        f: Open file to advise on.
+        advice: Name of an os.POSIX_FADV_* constant. Ignored on platforms
+            without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+    except OSError:
+        pass
+
+
+def _read_chunks(
+    f_in: BinaryIO, free: queue.SimpleQueue, filled: queue.SimpleQueue
+) -> None:
+    """Reader half of _copy_to_gzip's pipeline.
+
+    Takes empty buffers from free, fills them from f_in and passes
+    (buffer, length) pairs on through filled. Ends by putting None (EOF) or
+    the exception that stopped it on filled. A None on free asks it to stop.
+    """
+    try:
+        while (buf := free.get()) is not None:
+            n = f_in.readinto(buf)
+            if not n:
+                break
+            filled.put((buf, n))
+    except Exception as e:
+        filled.put(e)
+        return
+    filled.put(None)
+
+
+def _copy_to_gzip(f_in: BinaryIO, f_out: BinaryIO, size: int) -> None:
+    """Copy all of f_in into the gzip stream f_out.
+
+    Chunks are read directly into this thread's reusable buffers and handed
+    to the compressor as memoryview slices, so the data is copied once from
+    the kernel and the loop allocates nothing per chunk. This gets the
+    benefit of mmap without its hazard: a mapped file that a live writer
+    truncates mid-read raises SIGBUS and kills the process outright.
+
+    Files larger than one chunk are read on a separate thread, a few chunks
+    ahead of the compressor, so disk reads overlap with deflate. Both
+    readinto() and zlib release the GIL, so the two genuinely run in
+    parallel.
+
+    Args:
+        f_in: Unbuffered binary file to read from.
+        f_out: Writable gzip file object.
+        size: Expected size of f_in in bytes, used only to decide whether
+            the reader thread is worth starting.
+    """
+    bufs = _chunk_buffers()
+    if size <= COPY_BUFSIZE:
+        buf = bufs[0]
+        with memoryview(buf) as view:
+            while n := f_in.readinto(buf):
+                f_out.write(view[:n])
+        return
+
+    free: queue.SimpleQueue = queue.SimpleQueue()
+    filled: queue.SimpleQueue = queue.SimpleQueue()
+    for buf in bufs:
+        free.put(buf)
+    reader = threading.Thread(
+        target=_read_chunks, args=(f_in, free, filled), daemon=True
+    )
+    reader.start()
+    try:
+        while (item := filled.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            buf, n = item
+            with memoryview(buf) as view:
+                f_out.write(view[:n])
+            free.put(buf)
+    finally:
+        # Wake the reader if it is still waiting for a buffer.
+        free.put(None)
+        reader.join()
+
+
 def compress_file(
-    file_path: Path, dry_run: bool = False, compresslevel: int = 9
+    file_path: Path,
+    dry_run: bool = False,
+    compresslevel: int = 6,
+    compressor: str = "auto",
 ) -> tuple[CompressResult, int]:
     """Compress a single file using gzip.
 
@@ -78,7 +409,9 @@ def compress_file(
     Args:
         file_path: Path to the file to compress.
         dry_run: If True, simulate compression without making changes.
-        compresslevel: gzip compression level (1=fastest, 9=best, default: 9).
+        compresslevel: gzip compression level (1=fastest, 9=best, default: 6).
+        compressor: gzip backend to use; see COMPRESSORS (default: "auto",
+            the fastest one installed).
 
     Returns:
         Tuple of (result: CompressResult, bytes_saved: int)
@@ -89,23 +422,43 @@ def compress_file(
         logging.info(f"[DRY-RUN] Would compress: {file_path} -> {compressed_path}")
         return CompressResult.SUCCESS, 0
 
+    # Write under a temporary name and rename into place only once the data
+    # is on disk, so a crash never leaves a truncated .gz next to (or in
+    # place of) the original.
+    tmp_path = _temp_path(compressed_path)
+
     try:
         stat_before = file_path.stat()
         original_size = stat_before.st_size
 
-        # Compress file using shutil for memory efficiency
-        with open(file_path, "rb") as f_in:
-            with gzip.open(compressed_path, "wb", compresslevel=compresslevel) as f_out:
-                shutil.copyfileobj(f_in, f_out)
-
-        # Verify compressed file exists and is valid
-        if not compressed_path.exists():
-            raise IOError(f"Compressed file not created: {compressed_path}")
-
-        compressed_size = compressed_path.stat().st_size
-        if compressed_size == 0:
-            compressed_path.unlink()
-            raise IOError("Compressed file is empty")
+        # Stream in large chunks: each write into the gzip file is a
+        # Python-level call plus a deflate call, so bigger chunks mean far
+        # fewer of both. The input is read unbuffered since _copy_to_gzip
+        # reads straight into its own chunk-sized buffers.
+        with open(file_path, "rb", buffering=0) as f_in:
+            _fadvise(f_in, "POSIX_FADV_SEQUENTIAL")
+            with open(tmp_path, "wb", buffering=COPY_BUFSIZE) as raw_out:
+                with _open_gzip(
+                    raw_out,
+                    compressed_path.name,
+                    stat_before.st_mtime,
+                    compresslevel,
+                    compressor,
+                ) as f_out:
+                    _copy_to_gzip(f_in, f_out, original_size)
+                raw_out.flush()
+                compressed_size = raw_out.tell()
+                # Preserve original metadata (mode, mtime, etc.) on the
+                # compressed file so permissions and age-based handling
+                # carry over.
+                shutil.copystat(file_path, tmp_path)
+                os.fsync(raw_out.fileno())
+                # Rotated files are cold: neither the original nor its
+                # compressed copy is likely to be read again soon, so don't
+                # let them evict other processes' hot pages. Now that the
+                # output is synced its pages are clean and can be dropped.
+                _fadvise(raw_out, "POSIX_FADV_DONTNEED")
+            _fadvise(f_in, "POSIX_FADV_DONTNEED")
 
         # Active-file safety: if the original changed while we were reading it,
         # our compressed copy may be torn. Discard it and keep the original so a
@@ -118,12 +471,10 @@ def compress_file(
             logging.warning(
                 f"Skipped (modified during compression): {file_path}"
             )
-            compressed_path.unlink()
+            tmp_path.unlink()
             return CompressResult.IN_USE, 0
 
-        # Preserve original metadata (mode, mtime, etc.) on the compressed file
-        # so permissions and age-based handling carry over.
-        shutil.copystat(file_path, compressed_path)
+        os.replace(tmp_path, compressed_path)
 
         # Remove original file after successful compression
         file_path.unlink()
@@ -138,22 +489,549 @@ def compress_file(
     except Exception as e:
         logging.error(f"Failed to compress {file_path}: {e}")
         # Clean up partial compressed file if it exists
-        if compressed_path.exists():
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return CompressResult.FAILED, 0
+
+
+def _bundle_path(directory: Path, day: str) -> Path:
+    """Return an unused archive path for a day's bundle in directory."""
+    archive_path = directory / f"logs-{day}.tar.gz"
+    n = 0
+    while archive_path.exists():
+        n += 1
+        archive_path = directory / f"logs-{day}-{n}.tar.gz"
+    return archive_path
+
+
+def _bundle_files(
+    archive_path: Path,
+    members: list[tuple[Path, os.stat_result]],
+    dry_run: bool = False,
+    compresslevel: int = 6,
+    compressor: str = "auto",
+) -> ProcessingStats:
+    """Archive several small files into a single .tar.gz and remove them.
+
+    Compressing small files together lets DEFLATE reuse its dictionary
+    across them, giving a far better ratio than one .gz per file, and
+    leaves one inode behind instead of many. The same active-file check as
+    compress_file applies: any member whose size or mtime changed while the
+    archive was written is kept in place and counted as in use.
+
+    Args:
+        archive_path: Path of the archive to create; must not exist.
+        members: Files to archive, with their stat from the scan.
+        dry_run: If True, simulate without making changes.
+        compresslevel: gzip compression level (1=fastest, 9=best, default: 6).
+        compressor: gzip backend to use; see COMPRESSORS (default: "auto").
+
+    Returns:
+        ProcessingStats with the outcome for each member.
+    """
+    stats = ProcessingStats()
+    if dry_run:
+        logging.info(
+            f"[DRY-RUN] Would bundle {len(members)} files into {archive_path}"
+        )
+        stats.files_compressed += len(members)
+        return stats
+
+    # Date the archive by its newest member so age-based handling of the
+    # archive itself behaves like it would for the originals.
+    newest = max(st.st_mtime_ns for _, st in members)
+
+    # Give the archive only the permission bits every member shares, so it
+    # is never more widely readable than the most private file inside it.
+    mode = 0o777
+    for _, st in members:
+        mode &= st.st_mode & 0o777
+
+    # As in compress_file, write under a temporary name so a crash never
+    # leaves a truncated archive behind.
+    tmp_path = _temp_path(archive_path)
+    created = False
+    try:
+        fd = os.open(
+            tmp_path,
+            os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0),
+            mode,
+        )
+        created = True
+        with open(fd, "wb", buffering=COPY_BUFSIZE) as raw_out:
+            # The umask may have cleared bits that os.open was given.
+            os.chmod(tmp_path, mode)
+            with _open_gzip(
+                raw_out, archive_path.name, newest / 1e9, compresslevel, compressor
+            ) as f_out:
+                with tarfile.open(fileobj=f_out, mode="w") as tar:
+                    for path, _ in members:
+                        tar.add(path, arcname=path.name, recursive=False)
+            # The members are unlinked next; make sure the archive is on
+            # disk first.
+            raw_out.flush()
+            os.fsync(raw_out.fileno())
+            archive_size = raw_out.tell()
+        os.utime(tmp_path, ns=(newest, newest))
+        # Never overwrite an archive from an earlier run.
+        if archive_path.exists():
+            raise FileExistsError(f"{archive_path} already exists")
+        os.replace(tmp_path, archive_path)
+    except Exception as e:
+        logging.error(f"Failed to create bundle {archive_path}: {e}")
+        # Clean up partial archive if we created one
+        if created:
             try:
-                compressed_path.unlink()
+                tmp_path.unlink(missing_ok=True)
             except OSError:
                 pass
+        for path, _ in members:
+            _record_result(stats, path, CompressResult.FAILED, 0)
+        return stats
+
+    bundled = 0
+    bundled_size = 0
+    for path, stat_before in members:
+        try:
+            stat_after = path.stat()
+            if (
+                stat_after.st_mtime_ns != stat_before.st_mtime_ns
+                or stat_after.st_size != stat_before.st_size
+            ):
+                logging.warning(f"Skipped (modified during bundling): {path}")
+                _record_result(stats, path, CompressResult.IN_USE, 0)
+                continue
+            path.unlink()
+        except OSError as e:
+            logging.error(f"Failed to remove bundled file {path}: {e}")
+            _record_result(stats, path, CompressResult.FAILED, 0)
+            continue
+        bundled += 1
+        bundled_size += stat_before.st_size
+        _record_result(stats, path, CompressResult.SUCCESS, stat_before.st_size)
+
+    # If every member is still in place the archive only duplicates them,
+    # and the next run would bundle them again under a new name.
+    if not bundled:
+        logging.warning(f"No files removed; discarding bundle {archive_path}")
+        try:
+            archive_path.unlink()
+        except OSError as e:
+            logging.error(f"Failed to remove bundle {archive_path}: {e}")
+        return stats
+    stats.bytes_saved -= archive_size
+
+    logging.info(
+        f"Bundled {bundled} files into {archive_path} "
+        f"(saved {bundled_size - archive_size:,} bytes)"
+    )
+    return stats
+
+
+def _path_matcher(
+    pattern: str, recursive: bool
+) -> tuple[Callable[[list[str]], bool], Callable[[list[str]], bool]]:
+    """Build a matcher for a glob pattern that contains directory parts.
+
+    Follows Path.glob: each "*" or "?" stays within one path component, a
+    "**" component matches any number of directories, including none, and
+    empty and "." components are ignored. When recursive, the pattern may
+    start at any depth, as "**/pattern" would.
+
+    Args:
+        pattern: Glob pattern relative to the scanned directory.
+        recursive: If True, let the pattern match below any subdirectory.
+
+    Returns:
+        Tuple of (match, descend). Both take a relative path split into its
+        components. match returns whether the pattern matches that file;
+        descend returns whether anything below that directory could match,
+        so the scan can skip directories that cannot.
+    """
+    parts: list[str] = ["**"] if recursive else []
+    for part in pattern.replace(os.sep, "/").split("/"):
+        if part in ("", "."):
+            continue
+        if not (part == "**" and parts[-1:] == ["**"]):
+            parts.append(part)
+    matchers = [
+        None if part == "**"
+        else re.compile(fnmatch.translate(part), _PATTERN_FLAGS).match
+        for part in parts
+    ]
+
+    def match(path: list[str], i: int = 0, j: int = 0) -> bool:
+        if i == len(matchers):
+            return j == len(path)
+        component = matchers[i]
+        if component is None:
+            return any(match(path, i + 1, k) for k in range(j, len(path) + 1))
+        if j == len(path) or component(path[j]) is None:
+            return False
+        return match(path, i + 1, j + 1)
+
+    def descend(path: list[str], i: int = 0, j: int = 0) -> bool:
+        if j == len(path):
+            # A file below still needs at least one component to match.
+            return i < len(matchers)
+        if i == len(matchers):
+            return False
+        component = matchers[i]
+        if component is None:
+            return True
+        if component(path[j]) is None:
+            return False
+        return descend(path, i + 1, j + 1)
+
+    return match, descend
+
+
+def _scan_directory(path: str | Path) -> tuple[list[os.DirEntry], list[str]]:
+    """List a single directory.
+
+    Returns:
+        Tuple of (non-directory entries, subdirectories). Symlinks to
+        directories count as entries, never as subdirectories. Subdirectory
+        paths are kept as the strings scandir produced, so every path below
+        starts with path exactly as given (Path would drop a leading "./").
+    """
+    entries: list[os.DirEntry] = []
+    subdirs: list[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                entries.append(entry)
+    return entries, subdirs
+
+
+def _iter_entries(
+    dir_path: Path,
+    recursive: bool,
+    descend: Callable[[list[str]], bool] | None = None,
+) -> Iterator[os.DirEntry]:
+    """Yield every non-directory entry in dir_path.
+
+    Symlinked directories are never descended into. A subdirectory that
+    cannot be listed is logged and skipped so the rest of the tree is still
+    processed.
+
+    Listing a directory is mostly waiting on metadata I/O, so when recursing
+    into a tree with subdirectories they are listed concurrently on a thread
+    pool. Entries are yielded as each directory completes, in no particular
+    order. A flat directory is listed inline without starting any threads.
+
+    Args:
+        dir_path: Directory to list.
+        recursive: If True, also list all subdirectories.
+        descend: If given, only subdirectories for which it returns True
+            are listed. It is passed the subdirectory's path relative to
+            dir_path, split into its components.
+    """
+    root_prefix = os.path.join(dir_path, "")
+
+    def wanted(subdirs: list[str]) -> list[str]:
+        if descend is None:
+            return subdirs
+        return [
+            d for d in subdirs if descend(d[len(root_prefix):].split(os.sep))
+        ]
+
+    try:
+        entries, subdirs = _scan_directory(dir_path)
+    except OSError as e:
+        logging.warning(f"Cannot scan directory {dir_path}: {e}")
+        return
+    yield from entries
+    subdirs = wanted(subdirs)
+    if not recursive or not subdirs:
+        return
+
+    pool = ThreadPoolExecutor()
+    try:
+        pending = {pool.submit(_scan_directory, d): d for d in subdirs}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    entries, subdirs = future.result()
+                except OSError as e:
+                    logging.warning(f"Cannot scan directory {path}: {e}")
+                    continue
+                for d in wanted(subdirs):
+                    pending[pool.submit(_scan_directory, d)] = d
+                yield from entries
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _appears_compressed_on_disk(file_stat: os.stat_result) -> bool:
+    """Guess whether the filesystem already stores a file compressed.
+
+    On btrfs, ZFS or APFS with compression enabled, a compressible file
+    occupies noticeably fewer blocks than its size. gzipping it again
+    burns CPU for little or no gain on disk. Small files are never flagged,
+    since inline data and tail packing make their block counts meaningless.
+    Sparse files also match; manage_files(force=True) skips this check.
+
+    Args:
+        file_stat: Result of stat() on the file.
+    """
+    if file_stat.st_size < FS_COMPRESSED_MIN_SIZE:
+        return False
+    blocks = getattr(file_stat, "st_blocks", None)
+    if blocks is None:
+        return False
+    return blocks * 512 < file_stat.st_size * 0.9
+
+
+def _file_digest(file_path: Path) -> bytes:
+    """Return the BLAKE2b digest of a file's contents.
+
+    All hashing happens before any compression starts, so the pages read
+    here would be evicted again long before compress_file gets to them;
+    they are dropped straight away instead, as compress_file does.
+    """
+    digest = hashlib.blake2b()
+    buf = _chunk_buffers()[0]
+    with open(file_path, "rb", buffering=0) as f, memoryview(buf) as view:
+        _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+        _fadvise(f, "POSIX_FADV_DONTNEED")
+    return digest.digest()
+
+
+def _split_duplicates(
+    files: list[tuple[Path, os.stat_result]],
+) -> tuple[
+    list[tuple[Path, os.stat_result]],
+    list[tuple[Path, os.stat_result, Path, os.stat_result]],
+]:
+    """Separate files whose content repeats an earlier file's.
+
+    Only files that share their size with another file are hashed, so a
+    directory without duplicates costs nothing beyond the scan, and hashing
+    is far cheaper than the deflate it saves. A file that cannot be read
+    here is kept as unique and left for compress_file to deal with.
+
+    Args:
+        files: Candidate files with their stat from the scan, in the order
+            they will be compressed.
+
+    Returns:
+        Tuple of (unique files, duplicates). Each duplicate is returned as
+        (path, stat, path of the earlier file with the same content, that
+        file's stat), both stats being the ones from the scan.
+    """
+    size_counts = Counter(file_stat.st_size for _, file_stat in files)
+
+    unique: list[tuple[Path, os.stat_result]] = []
+    duplicates: list[tuple[Path, os.stat_result, Path, os.stat_result]] = []
+    # Hard links cannot cross filesystems, so only dedupe within a device.
+    seen: dict[tuple[int, int, bytes], tuple[Path, os.stat_result]] = {}
+    for file_path, file_stat in files:
+        if size_counts[file_stat.st_size] > 1:
+            try:
+                key = (
+                    file_stat.st_dev,
+                    file_stat.st_size,
+                    _file_digest(file_path),
+                )
+            except OSError as e:
+                logging.warning(f"Cannot hash {file_path}: {e}")
+            else:
+                if key in seen:
+                    duplicates.append((file_path, file_stat, *seen[key]))
+                    continue
+                seen[key] = (file_path, file_stat)
+        unique.append((file_path, file_stat))
+    return unique, duplicates
+
+
+def _link_duplicate(
+    file_path: Path,
+    stat_before: os.stat_result,
+    target: Path,
+    dry_run: bool = False,
+    compresslevel: int = 6,
+    compressor: str = "auto",
+) -> tuple[CompressResult, int]:
+    """Replace a file with a hard link to an identical file's .gz.
+
+    The link shares the target's inode, so the duplicate's .gz carries the
+    target's permissions and mtime, and its gzip header names the target.
+    As with compress_file, a file whose size or mtime changed since the
+    scan is left untouched. If the filesystem refuses the link, the file
+    is compressed on its own instead.
+
+    Args:
+        file_path: Duplicate file to replace.
+        stat_before: Result of stat() on file_path from the scan.
+        target: Existing .gz holding the same content.
+        dry_run: If True, simulate without making changes.
+        compresslevel: gzip compression level used if linking fails
+            (1=fastest, 9=best, default: 6).
+        compressor: gzip backend used if linking fails; see COMPRESSORS
+            (default: "auto").
+
+    Returns:
+        Tuple of (result: CompressResult, bytes_saved: int)
+    """
+    compressed_path = file_path.with_suffix(file_path.suffix + ".gz")
+
+    if dry_run:
+        logging.info(
+            f"[DRY-RUN] Would link duplicate: {compressed_path} -> {target}"
+        )
+        return CompressResult.SUCCESS, 0
+
+    tmp_path = _temp_path(compressed_path)
+    try:
+        stat_after = file_path.stat()
+        if (
+            stat_after.st_mtime_ns != stat_before.st_mtime_ns
+            or stat_after.st_size != stat_before.st_size
+        ):
+            logging.warning(f"Skipped (modified since scan): {file_path}")
+            return CompressResult.IN_USE, 0
+
+        try:
+            os.link(target, tmp_path)
+        except OSError as e:
+            # e.g. EXDEV across mount points, or no hard link support.
+            logging.debug(f"Cannot link {target} ({e}); compressing instead")
+            return compress_file(file_path, False, compresslevel, compressor)
+        os.replace(tmp_path, compressed_path)
+        file_path.unlink()
+
+        logging.info(
+            f"Deduplicated: {file_path} -> {compressed_path} "
+            f"(linked to {target}, saved {stat_before.st_size:,} bytes)"
+        )
+        return CompressResult.SUCCESS, stat_before.st_size
+
+    except Exception as e:
+        logging.error(f"Failed to link duplicate {file_path}: {e}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
         return CompressResult.FAILED, 0
 
 
+def _init_worker_logging(log_queue: multiprocessing.Queue, level: int) -> None:
+    """Pool initializer: send this worker's log records to the parent.
+
+    Used when workers are not forked and so start without the parent's
+    logging configuration.
+
+    Args:
+        log_queue: Queue drained by a QueueListener in the parent.
+        level: The parent's root logger level.
+    """
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+@contextmanager
+def _process_pool(jobs: int) -> Iterator[ProcessPoolExecutor]:
+    """Start a pool of compression workers that log like the parent.
+
+    Forked workers inherit the logging configuration as-is. Where fork is
+    unavailable, workers are spawned and forward their records through a
+    queue to the parent's handlers, so --log-file still gets every line.
+
+    Args:
+        jobs: Number of worker processes.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            yield executor
+        return
+
+    mp_context = multiprocessing.get_context("spawn")
+    log_queue = mp_context.Queue()
+    root = logging.getLogger()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=mp_context,
+            initializer=_init_worker_logging,
+            initargs=(log_queue, root.level),
+        ) as executor:
+            yield executor
+    finally:
+        listener.stop()
+
+
+def _compress_batch(
+    paths: list[Path],
+    dry_run: bool = False,
+    compresslevel: int = 6,
+    compressor: str = "auto",
+) -> ProcessingStats:
+    """Compress several files in turn; the unit of work for pool workers.
+
+    Args:
+        paths: Files to compress.
+        dry_run: If True, simulate compression without making changes.
+        compresslevel: gzip compression level (1=fastest, 9=best, default: 6).
+        compressor: gzip backend to use; see COMPRESSORS (default: "auto").
+
+    Returns:
+        ProcessingStats with the combined outcome for the batch.
+    """
+    stats = ProcessingStats()
+    for file_path in paths:
+        result, bytes_saved = compress_file(
+            file_path, dry_run, compresslevel, compressor
+        )
+        _record_result(stats, file_path, result, bytes_saved)
+    return stats
+
+
+def _record_result(
+    stats: ProcessingStats,
+    file_path: Path,
+    result: CompressResult,
+    bytes_saved: int,
+) -> None:
+    """Fold the outcome of a single compress_file call into stats."""
+    if result is CompressResult.SUCCESS:
+        stats.files_compressed += 1
+        stats.bytes_saved += bytes_saved
+    elif result is CompressResult.IN_USE:
+        stats.files_in_use += 1
+    else:
+        stats.files_failed += 1
+        stats.errors.append(f"Failed to compress: {file_path}")
+
+
 def manage_files(
     directory: str | Path,
     days: int = 5,
     dry_run: bool = False,
     recursive: bool = False,
     pattern: str = "*",
-    compresslevel: int = 9,
+    compresslevel: int = 6,
     min_size: int = 0,
+    jobs: int = 1,
+    compressor: str = "auto",
+    bundle_below: int = 0,
+    force: bool = False,
+    dedupe: bool = False,
 ) -> ProcessingStats:
     """Scan directory and compress files older than specified days.
 
@@ -162,16 +1040,34 @@ def manage_files(
         days: Compress files older than this many days.
         dry_run: If True, simulate without making changes.
         recursive: If True, process subdirectories.
-        pattern: Glob pattern selecting which files to consider (default: "*").
-        compresslevel: gzip compression level (1=fastest, 9=best, default: 9).
-        min_size: Skip files smaller than this many bytes (default: 0).
+        pattern: Glob pattern selecting which files to consider, matched
+            against file names, or against paths relative to directory if it
+            contains a "/" (default: "*").
+        compresslevel: gzip compression level (1=fastest, 9=best, default: 6).
+        min_size: Skip files smaller than this many bytes rather than
+            compress them individually; files bundled because of
+            bundle_below are exempt (default: 0).
+        jobs: Number of worker processes used for compression (default: 1,
+            compress in the current process).
+        compressor: gzip backend to use; see COMPRESSORS (default: "auto").
+        bundle_below: Files smaller than this many bytes are archived
+            together into one logs-YYYYMMDD.tar.gz per directory and
+            modification date instead of being compressed individually
+            (default: 0, disabled).
+        force: If True, also compress files that appear to be stored
+            compressed by the filesystem already (default: False).
+        dedupe: If True, files with identical content are compressed only
+            once; each duplicate's .gz is a hard link to the first one's
+            (default: False).
 
     Returns:
         ProcessingStats with results of the operation.
     """
     stats = ProcessingStats()
-    age_threshold = days * 24 * 60 * 60
-    current_time = time.time()
+    # Files modified at or after this instant are too recent. Integer
+    # nanoseconds keep the per-file check a plain int compare with no float
+    # rounding, and st_mtime_ns comes from the same stat() call.
+    threshold_ns = time.time_ns() - days * 86_400 * 1_000_000_000
 
     dir_path = Path(directory)
 
@@ -185,56 +1081,190 @@ def manage_files(
         stats.errors.append(f"Path is not a directory: {directory}")
         return stats
 
-    # Apply the pattern at every level when recursing, else only the top level.
-    glob_pattern = f"**/{pattern}" if recursive else pattern
+    # Phase 1: decide which files are old enough to compress. This is cheap
+    # metadata work, so it stays in the current process. DirEntry answers
+    # is_symlink()/is_file() from the directory listing itself, leaving a
+    # single stat() per candidate file.
+    eligible: list[tuple[Path, os.stat_result]] = []
+    bundles: dict[tuple[Path, str], list[tuple[Path, os.stat_result]]] = {}
+    # Resolve per-run constants once rather than per entry: fnmatch.fnmatch
+    # re-normalizes and re-looks-up the compiled pattern on every call, and
+    # "*" needs no matching at all. A pattern with a directory part has to
+    # be matched against the whole relative path, which means walking
+    # subdirectories even without recursive, but only those it could match
+    # below.
+    match_name = None
+    match_path = None
+    descend = None
+    if "/" in pattern or os.sep in pattern:
+        match_path, descend = _path_matcher(pattern, recursive)
+        root_prefix = os.path.join(dir_path, "")
+    elif pattern != "*":
+        match_name = re.compile(fnmatch.translate(pattern), _PATTERN_FLAGS).match
+    skip_suffixes = tuple(INCOMPRESSIBLE)
+
+    for entry in _iter_entries(
+        dir_path, recursive or match_path is not None, descend
+    ):
+        name = entry.name
+        # Output still being written, or left behind by a crashed run: never
+        # a candidate, whatever the pattern.
+        if _TEMP_NAME.search(name):
+            if entry.is_file(follow_symlinks=False):
+                _remove_stale_temp(entry, dry_run)
+            continue
+
+        if match_path is not None:
+            if not match_path(entry.path[len(root_prefix):].split(os.sep)):
+                continue
+        elif match_name is not None and match_name(name) is None:
+            continue
 
-    for file_path in dir_path.glob(glob_pattern):
         # Skip symlinks to avoid compressing files outside the tree,
         # following dangling links, or recursing through linked directories.
-        if file_path.is_symlink():
-            logging.debug(f"Skipped (symlink): {file_path}")
+        if entry.is_symlink():
+            logging.debug(f"Skipped (symlink): {entry.path}")
             continue
 
-        if not file_path.is_file():
+        if not entry.is_file(follow_symlinks=False):
             continue
 
-        # Skip already compressed files
-        if file_path.suffix == ".gz":
+        # Skip files whose format is already compressed
+        if name.lower().endswith(skip_suffixes):
+            logging.debug(f"Skipped (already compressed format): {entry.path}")
             continue
 
         stats.files_scanned += 1
 
         try:
-            file_stat = file_path.stat()
-            file_age = current_time - file_stat.st_mtime
+            file_stat = entry.stat(follow_symlinks=False)
+            file_path = Path(entry.path)
 
-            if file_stat.st_size < min_size:
+            if file_stat.st_mtime_ns >= threshold_ns:
                 stats.files_skipped += 1
-                logging.debug(f"Skipped (smaller than min-size): {file_path}")
-            elif file_age > age_threshold:
-                result, bytes_saved = compress_file(
-                    file_path, dry_run, compresslevel
-                )
-                if result is CompressResult.SUCCESS:
-                    stats.files_compressed += 1
-                    stats.bytes_saved += bytes_saved
-                elif result is CompressResult.IN_USE:
-                    stats.files_in_use += 1
-                else:
-                    stats.files_failed += 1
-                    stats.errors.append(f"Failed to compress: {file_path}")
-            else:
+                logging.debug(f"Skipped (too recent): {entry.path}")
+            elif not force and _appears_compressed_on_disk(file_stat):
+                stats.files_skipped += 1
+                logging.debug(f"Skipped (appears fs-compressed): {entry.path}")
+            elif file_stat.st_size < bundle_below:
+                # min_size guards against a .gz per tiny file; bundling
+                # those is exactly what bundle_below is for.
+                day = datetime.fromtimestamp(file_stat.st_mtime)
+                key = (file_path.parent, day.strftime("%Y%m%d"))
+                bundles.setdefault(key, []).append((file_path, file_stat))
+            elif file_stat.st_size < min_size:
                 stats.files_skipped += 1
-                logging.debug(f"Skipped (too recent): {file_path}")
+                logging.debug(f"Skipped (smaller than min-size): {entry.path}")
+            else:
+                eligible.append((file_path, file_stat))
 
         except Exception as e:
             stats.files_failed += 1
-            stats.errors.append(f"Error processing {file_path}: {e}")
-            logging.error(f"Error processing {file_path}: {e}")
+            stats.errors.append(f"Error processing {entry.path}: {e}")
+            logging.error(f"Error processing {entry.path}: {e}")
+
+    # A bundle of one gains nothing over a plain .gz, so it is treated like
+    # any other file, min_size included.
+    for members in bundles.values():
+        if len(members) > 1:
+            continue
+        file_path, file_stat = members[0]
+        if file_stat.st_size < min_size:
+            stats.files_skipped += 1
+            logging.debug(f"Skipped (smaller than min-size): {file_path}")
+        else:
+            eligible.append((file_path, file_stat))
+
+    # Directory order is not disk order. Inode numbers roughly follow
+    # on-disk allocation on ext4/XFS, so visiting files by inode turns the
+    # batch into a mostly sequential read instead of seeking back and forth.
+    # The stat results are the ones cached during the scan: no extra syscalls.
+    eligible.sort(key=lambda item: (item[1].st_dev, item[1].st_ino))
+
+    duplicates: list[tuple[Path, os.stat_result, Path, os.stat_result]] = []
+    if dedupe:
+        eligible, duplicates = _split_duplicates(eligible)
+    paths = [file_path for file_path, _ in eligible]
+
+    # Phase 2: compress. DEFLATE is CPU-bound, so spread files across worker
+    # processes; a pool isn't worth its startup cost for a single file. The
+    # scan threads have all exited by now, so forking the workers is safe.
+    if jobs == 1 or len(paths) <= 1:
+        stats.merge(_compress_batch(paths, dry_run, compresslevel, compressor))
+    else:
+        # Hand out runs of neighbouring files: each worker keeps the
+        # inode-ordered reads, and only one stats object per batch has to
+        # be pickled back.
+        batches = [
+            paths[i:i + PARALLEL_BATCH]
+            for i in range(0, len(paths), PARALLEL_BATCH)
+        ]
+        compress = functools.partial(
+            _compress_batch,
+            dry_run=dry_run,
+            compresslevel=compresslevel,
+            compressor=compressor,
+        )
+        with _process_pool(jobs) as executor:
+            try:
+                for batch_stats in executor.map(compress, batches):
+                    stats.merge(batch_stats)
+            except Exception as e:
+                stats.errors.append(f"Compression worker failed: {e}")
+                logging.error(f"Compression worker failed: {e}")
+
+    # Link each duplicate to its original's .gz, but only if that original
+    # really was compressed, and compressed as it was when hashed: if it was
+    # appended to after the scan, its .gz holds different content. copystat
+    # gives the .gz the mtime the original had when it was compressed, so
+    # any change since the scan shows up there. Otherwise compress the
+    # duplicate itself.
+    for file_path, file_stat, original, original_stat in duplicates:
+        target = original.with_suffix(original.suffix + ".gz")
+        try:
+            linkable = dry_run or (
+                not original.exists()
+                and target.stat().st_mtime_ns == original_stat.st_mtime_ns
+            )
+        except OSError:
+            linkable = False
+        if linkable:
+            result, bytes_saved = _link_duplicate(
+                file_path, file_stat, target, dry_run, compresslevel, compressor
+            )
+        else:
+            result, bytes_saved = compress_file(
+                file_path, dry_run, compresslevel, compressor
+            )
+        _record_result(stats, file_path, result, bytes_saved)
+
+    for (directory, day), members in bundles.items():
+        if len(members) > 1:
+            stats.merge(
+                _bundle_files(
+                    _bundle_path(directory, day),
+                    members,
+                    dry_run,
+                    compresslevel,
+                    compressor,
+                )
+            )
 
     return stats
 
 
+def available_cpus() -> int:
+    """Return the number of CPUs this process is allowed to run on.
+
+    Unlike os.cpu_count(), this honours CPU affinity and cpuset limits, so
+    a run under taskset or in a CPU-limited container does not start more
+    workers than it has CPUs.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def non_negative_int(value: str) -> int:
     """Argparse type for a non-negative integer.
 
@@ -256,6 +1286,27 @@ def non_negative_int(value: str) -> int:
     return parsed
 
 
+def positive_int(value: str) -> int:
+    """Argparse type for a positive integer.
+
+    Args:
+        value: Raw command line argument value.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"must be positive, got {parsed}")
+    return parsed
+
+
 def compression_level(value: str) -> int:
     """Argparse type for a gzip compression level (1-9).
 
@@ -321,6 +1372,10 @@ Examples:
   %(prog)s /var/log/myapp -p '*.log'   # Only files matching the pattern
   %(prog)s /var/log/myapp -c 1         # Fastest compression
   %(prog)s /var/log/myapp -m 4K        # Skip files smaller than 4 KiB
+  %(prog)s /var/log/myapp -b 64K       # Archive files under 64 KiB by day
+  %(prog)s /var/log/myapp --dedupe     # Compress identical files only once
+  %(prog)s /var/log/myapp -j 1         # Compress in a single process
+  %(prog)s /var/log/myapp --compressor stdlib  # Force the stdlib gzip module
         """,
     )
     parser.add_argument(
@@ -341,21 +1396,64 @@ Examples:
     parser.add_argument(
         "-p", "--pattern",
         default="*",
-        help="Glob pattern selecting which files to consider (default: '*')",
+        help="Glob pattern selecting which files to consider, matched "
+             "against file names, or against paths relative to DIRECTORY if "
+             "it contains '/'; '**' matches any number of directories "
+             "(default: '*')",
     )
     parser.add_argument(
         "-c", "--compresslevel",
         type=compression_level,
-        default=9,
-        help="gzip compression level, 1=fastest to 9=best (default: 9)",
+        default=6,
+        help="gzip compression level, 1=fastest to 9=best; ISA-L has only "
+             "levels 0-3, so with it 1-2, 3-4, 5-6 and 7-9 run at 0, 1, 2 "
+             "and 3 (default: 6)",
+    )
+    parser.add_argument(
+        "--compressor",
+        choices=("auto",) + COMPRESSORS,
+        default="auto",
+        help="gzip implementation: isal (ISA-L, levels mapped to 0-3; see "
+             "--compresslevel), zlibng (zlib-ng), or stdlib; auto picks the "
+             "fastest installed (default: auto)",
     )
     parser.add_argument(
         "-m", "--min-size",
         type=human_size,
+        default=1024,
+        metavar="BYTES",
+        help="Skip files smaller than this size, where gzip's framing "
+             "outweighs any savings; files archived by --bundle-below are "
+             "exempt; accepts K/M/G suffixes (default: 1K)",
+    )
+    parser.add_argument(
+        "-b", "--bundle-below",
+        type=human_size,
         default=0,
         metavar="BYTES",
-        help="Skip files smaller than this size; accepts K/M/G suffixes "
-             "(default: 0, no minimum)",
+        help="Archive files smaller than this size together into one "
+             "logs-YYYYMMDD.tar.gz per directory and day instead of one .gz "
+             "each; accepts K/M/G suffixes (default: 0, disabled)",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=positive_int,
+        default=available_cpus(),
+        metavar="N",
+        help="Number of files to compress in parallel "
+             "(default: number of CPUs available to the process)",
+    )
+    parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Compress files even if the filesystem appears to store them "
+             "compressed already (btrfs/ZFS/APFS compression)",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Compress files with identical content only once; the other "
+             "copies' .gz files become hard links to the first",
     )
     parser.add_argument(
         "-n", "--dry-run",
@@ -371,7 +1469,10 @@ Examples:
         action="store_true",
         help="Enable verbose output",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.compressor != "auto" and args.compressor not in available_compressors():
+        parser.error(f"compressor {args.compressor!r} is not installed")
+    return args
 
 
 def main() -> int:
@@ -389,6 +1490,15 @@ def main() -> int:
 
     logging.info(f"Starting file management: {args.directory}")
     logging.info(f"Compressing files older than {args.days} days")
+    backend = resolve_compressor(args.compressor)
+    level = backend_level(backend, args.compresslevel)
+    if level == args.compresslevel:
+        logging.info(f"Using gzip backend: {backend}, level {level}")
+    else:
+        logging.info(
+            f"Using gzip backend: {backend}, level {level} "
+            f"(from --compresslevel {args.compresslevel})"
+        )
 
     stats = manage_files(
         directory=args.directory,
@@ -398,6 +1508,11 @@ def main() -> int:
         pattern=args.pattern,
         compresslevel=args.compresslevel,
         min_size=args.min_size,
+        jobs=args.jobs,
+        compressor=args.compressor,
+        bundle_below=args.bundle_below,
+        force=args.force,
+        dedupe=args.dedupe,
     )
 
     logging.info(f"Completed: {stats}")
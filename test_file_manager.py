@@ -1,10 +1,11 @@
 """Tests for file_manager.py"""
 
 import argparse
+import errno
 import gzip
 import logging
 import os
-import shutil
+import tarfile
 import tempfile
 import time
 from pathlib import Path
@@ -12,14 +13,19 @@ from unittest.mock import patch
 
 import pytest
 
+import file_manager
 from file_manager import (
     CompressResult,
     ProcessingStats,
+    available_compressors,
+    available_cpus,
+    backend_level,
     compress_file,
     compression_level,
     human_size,
     manage_files,
     non_negative_int,
+    positive_int,
     setup_logging,
 )
 
@@ -67,6 +73,37 @@ class TestProcessingStats:
         assert stats.bytes_saved == 0
         assert stats.errors == []
 
+    def test_merge(self):
+        """Merging should add every counter and concatenate errors."""
+        total = ProcessingStats(
+            files_scanned=2, files_compressed=1, bytes_saved=10, errors=["a"]
+        )
+        other = ProcessingStats(
+            files_scanned=3,
+            files_skipped=1,
+            files_failed=1,
+            files_in_use=1,
+            bytes_saved=-4,
+            errors=["b"],
+        )
+
+        total.merge(other)
+
+        assert total == ProcessingStats(
+            files_scanned=5,
+            files_compressed=1,
+            files_skipped=1,
+            files_failed=1,
+            files_in_use=1,
+            bytes_saved=6,
+            errors=["a", "b"],
+        )
+        assert other.errors == ["b"]
+
+    def test_uses_slots(self):
+        """Stats instances should not carry a per-instance __dict__."""
+        assert not hasattr(ProcessingStats(), "__dict__")
+
     def test_str_representation(self):
         """Stats should have readable string representation."""
         stats = ProcessingStats(
@@ -114,6 +151,49 @@ class TestCompressFile:
             decompressed = f.read()
         assert decompressed == content
 
+    @pytest.mark.parametrize("size", [0, 3 * (1 << 20) + 123])
+    def test_compress_file_round_trips_bytes(self, temp_dir, size):
+        """Empty files and files spanning several chunks should round-trip."""
+        file_path = temp_dir / "data.bin"
+        content = os.urandom(1024) * (size // 1024) + os.urandom(size % 1024)
+        file_path.write_bytes(content)
+
+        result, _ = compress_file(file_path)
+
+        assert result is CompressResult.SUCCESS
+        with gzip.open(temp_dir / "data.bin.gz", "rb") as f:
+            assert f.read() == content
+
+    def test_chunk_buffers_reused_across_files(self, temp_dir):
+        """Consecutive files should share the same chunk buffers."""
+        bufs = list(file_manager._chunk_buffers())
+        for name in ("a.log", "b.log"):
+            (temp_dir / name).write_text("Test content " * 100)
+            compress_file(temp_dir / name)
+
+        assert all(
+            a is b for a, b in zip(file_manager._chunk_buffers(), bufs)
+        )
+
+    def test_compress_file_read_error_mid_pipeline(self, temp_dir):
+        """A read error on the reader thread should fail cleanly."""
+        file_path = temp_dir / "big.bin"
+        file_path.write_bytes(os.urandom(3 * (1 << 20)))
+        reads = 0
+
+        def failing_reader(f_in, free, filled):
+            nonlocal reads
+            reads += 1
+            filled.put(OSError("disk went away"))
+
+        with patch("file_manager._read_chunks", side_effect=failing_reader):
+            result, bytes_saved = compress_file(file_path)
+
+        assert reads == 1
+        assert result is CompressResult.FAILED
+        assert file_path.exists()
+        assert not (temp_dir / "big.bin.gz").exists()
+
     def test_compress_file_respects_level(self, temp_dir):
         """Should produce a valid gzip regardless of compression level."""
         file_path = temp_dir / "test.log"
@@ -127,6 +207,72 @@ class TestCompressFile:
         with gzip.open(compressed_path, "rt") as f:
             assert f.read() == content
 
+    @pytest.mark.parametrize("compressor", ["auto", "stdlib", "isal", "zlibng"])
+    @pytest.mark.parametrize("level", [1, 9])
+    def test_compress_file_backends(self, temp_dir, compressor, level):
+        """Every installed backend should produce standard gzip output."""
+        if compressor != "auto" and compressor not in available_compressors():
+            pytest.skip(f"{compressor} not installed")
+        file_path = temp_dir / "test.log"
+        content = "Test content for compression" * 100
+        file_path.write_text(content)
+
+        result, _ = compress_file(
+            file_path, compresslevel=level, compressor=compressor
+        )
+
+        assert result is CompressResult.SUCCESS
+        with gzip.open(temp_dir / "test.log.gz", "rt") as f:
+            assert f.read() == content
+
+    def test_compress_file_failure_keeps_existing_gz(self, temp_dir):
+        """A failed compression should not touch an existing .gz."""
+        file_path = temp_dir / "test.log"
+        file_path.write_text("new content " * 100)
+        existing = temp_dir / "test.log.gz"
+        existing.write_bytes(b"earlier output")
+
+        with patch(
+            "file_manager._copy_to_gzip", side_effect=OSError("disk full")
+        ):
+            result, _ = compress_file(file_path)
+
+        assert result is CompressResult.FAILED
+        assert file_path.exists()
+        assert existing.read_bytes() == b"earlier output"
+        assert sorted(temp_dir.iterdir()) == [file_path, existing]
+
+    @pytest.mark.parametrize("compressor", ["stdlib", "isal", "zlibng"])
+    def test_compress_file_header_names_original(self, temp_dir, compressor):
+        """The gzip header should record the original name and mtime."""
+        if compressor not in available_compressors():
+            pytest.skip(f"{compressor} not installed")
+        file_path = temp_dir / "app.log"
+        file_path.write_text("Test content for compression" * 100)
+        old_time = int(time.time()) - (10 * 24 * 60 * 60)
+        os.utime(file_path, (old_time, old_time))
+
+        compress_file(file_path, compressor=compressor)
+
+        header = (temp_dir / "app.log.gz").read_bytes()
+        assert header[3] & 0x08  # FNAME present
+        assert int.from_bytes(header[4:8], "little") == old_time
+        assert header[10:].split(b"\0", 1)[0] == b"app.log"
+
+    @pytest.mark.parametrize("mtime", [-864000, 2**32 + 5])
+    def test_compress_file_mtime_outside_header_range(self, temp_dir, mtime):
+        """An mtime the gzip header cannot hold should be recorded as 0."""
+        file_path = temp_dir / "app.log"
+        file_path.write_text("Test content for compression" * 100)
+        os.utime(file_path, (mtime, mtime))
+
+        result, _ = compress_file(file_path)
+
+        assert result is CompressResult.SUCCESS
+        compressed = temp_dir / "app.log.gz"
+        assert int.from_bytes(compressed.read_bytes()[4:8], "little") == 0
+        assert compressed.stat().st_mtime == mtime
+
     def test_compress_file_dry_run(self, temp_dir):
         """Dry run should not modify files."""
         file_path = temp_dir / "test.log"
@@ -172,30 +318,46 @@ class TestCompressFile:
         assert (stat.st_mode & 0o777) == 0o640
         assert stat.st_mtime == pytest.approx(old_time, abs=1)
 
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable"
+    )
+    def test_compress_file_advises_page_cache(self, temp_dir):
+        """Should read sequentially and drop both files from the page cache."""
+        file_path = temp_dir / "test.log"
+        file_path.write_text("Test content for compression" * 100)
+
+        with patch("file_manager.os.posix_fadvise") as fadvise:
+            result, _ = compress_file(file_path)
+
+        assert result is CompressResult.SUCCESS
+        advice = [c.args[3] for c in fadvise.call_args_list]
+        assert advice[0] == os.POSIX_FADV_SEQUENTIAL
+        assert advice.count(os.POSIX_FADV_DONTNEED) == 2
+
     def test_compress_file_modified_during_copy(self, temp_dir):
         """Should not delete the original if it changes while being read."""
         file_path = temp_dir / "active.log"
         file_path.write_text("initial content " * 100)
 
-        real_copy = shutil.copyfileobj
+        real_copy = file_manager._copy_to_gzip
 
-        def copy_then_modify(f_in, f_out, *args, **kwargs):
+        def copy_then_modify(*args, **kwargs):
             # Perform the real copy, then simulate a live writer appending.
-            real_copy(f_in, f_out)
+            real_copy(*args, **kwargs)
             with open(file_path, "a") as f:
                 f.write("appended by another writer")
             future = time.time() + 10
             os.utime(file_path, (future, future))
 
         with patch(
-            "file_manager.shutil.copyfileobj", side_effect=copy_then_modify
+            "file_manager._copy_to_gzip", side_effect=copy_then_modify
         ):
             result, bytes_saved = compress_file(file_path)
 
         assert result is CompressResult.IN_USE
         assert bytes_saved == 0
         assert file_path.exists()  # original preserved
-        assert not (temp_dir / "active.log.gz").exists()  # partial removed
+        assert list(temp_dir.iterdir()) == [file_path]  # partial removed
 
 
 class TestManageFiles:
@@ -232,6 +394,45 @@ class TestManageFiles:
         assert stats.files_scanned == 0
         assert gz_file.exists()
 
+    @pytest.mark.parametrize("name", ["photo.JPG", "archive.zip", "data.zst"])
+    def test_skip_incompressible_formats(self, temp_dir, name):
+        """Should skip files whose format is already compressed."""
+        path = temp_dir / name
+        path.write_bytes(b"already compressed payload")
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        os.utime(path, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5)
+
+        assert stats.files_scanned == 0
+        assert path.exists()
+        assert not (temp_dir / f"{name}.gz").exists()
+
+    @pytest.mark.skipif(os.name != "posix", reason="needs os.kill(pid, 0)")
+    def test_stale_temp_files_removed(self, temp_dir):
+        """Leftover temp output should be removed only once its writer exits."""
+        import subprocess
+        import sys
+
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+        stale = temp_dir / f"app.log.gz.tmp-{exited.pid}"
+        live = temp_dir / f"other.log.gz.tmp-{os.getppid()}"
+        for f in (stale, live):
+            f.write_text("truncated")
+            os.utime(f, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5, dry_run=True)
+        assert stale.exists()
+
+        stats = manage_files(temp_dir, days=5)
+
+        assert stats.files_scanned == 0
+        assert not stale.exists()
+        assert live.read_text() == "truncated"
+        assert sorted(temp_dir.iterdir()) == [live]
+
     def test_mixed_files(self, temp_dir, old_file, new_file):
         """Should handle mix of old and new files."""
         stats = manage_files(temp_dir, days=5)
@@ -304,6 +505,42 @@ class TestManageFiles:
         assert link.is_symlink()
         assert not (temp_dir / "link.log.gz").exists()
 
+    def test_recursive_deep_tree(self, temp_dir):
+        """Should find files at every level of a wide, deep tree."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        expected = []
+        for i in range(4):
+            for depth in range(1, 4):
+                d = temp_dir.joinpath(*(f"d{i}_{n}" for n in range(depth)))
+                d.mkdir(parents=True, exist_ok=True)
+                f = d / "app.log"
+                f.write_text("Nested content")
+                os.utime(f, (old_time, old_time))
+                expected.append(f)
+
+        stats = manage_files(temp_dir, days=5, recursive=True)
+
+        assert stats.files_scanned == len(expected)
+        assert stats.files_compressed == len(expected)
+        assert all(f.with_suffix(".log.gz").exists() for f in expected)
+
+    def test_recursive_skips_symlinked_directories(self, temp_dir):
+        """Recursive mode should not descend into symlinked directories."""
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        target = outside / "target.log"
+        target.write_text("Outside content")
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        os.utime(target, (old_time, old_time))
+        tree = temp_dir / "tree"
+        tree.mkdir()
+        (tree / "linked").symlink_to(outside, target_is_directory=True)
+
+        stats = manage_files(tree, days=5, recursive=True)
+
+        assert stats.files_scanned == 0
+        assert target.exists()
+
     def test_pattern_filter(self, temp_dir):
         """Should only consider files matching the pattern."""
         old_time = time.time() - (10 * 24 * 60 * 60)
@@ -335,6 +572,84 @@ class TestManageFiles:
         assert stats.files_compressed == 2
         assert (subdir / "other.txt").exists()
 
+    @pytest.mark.parametrize(
+        "pattern, recursive, expected",
+        [
+            ("sub/*.log", False, {"sub/a.log"}),
+            ("./sub/*.log", False, {"sub/a.log"}),
+            ("*/*.log", False, {"sub/a.log", "other/d.log"}),
+            (
+                "**/*.log",
+                False,
+                {
+                    "top.log",
+                    "sub/a.log",
+                    "sub/deep/b.log",
+                    "other/d.log",
+                    "x/sub/c.log",
+                },
+            ),
+            ("sub/*.log", True, {"sub/a.log", "x/sub/c.log"}),
+            ("sub/**/*.log", False, {"sub/a.log", "sub/deep/b.log"}),
+        ],
+    )
+    def test_pattern_with_directories(
+        self, temp_dir, pattern, recursive, expected
+    ):
+        """Patterns containing '/' should match relative paths like glob."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        names = [
+            "top.log",
+            "sub/a.log",
+            "sub/deep/b.log",
+            "other/d.log",
+            "x/sub/c.log",
+            "sub/e.txt",
+        ]
+        for name in names:
+            f = temp_dir / name
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text("content")
+            os.utime(f, (old_time, old_time))
+
+        stats = manage_files(
+            temp_dir, days=5, pattern=pattern, recursive=recursive
+        )
+
+        compressed = {n for n in names if (temp_dir / f"{n}.gz").exists()}
+        assert compressed == expected
+        assert stats.files_scanned == len(expected)
+
+    def test_pattern_with_directories_prunes_scan(self, temp_dir):
+        """Only directories the pattern could match below should be listed."""
+        for d in ("sub/deep", "other", "x/sub"):
+            (temp_dir / d).mkdir(parents=True)
+
+        with patch(
+            "file_manager._scan_directory", wraps=file_manager._scan_directory
+        ) as scan:
+            manage_files(temp_dir, days=5, pattern="sub/*.log")
+
+        listed = {
+            os.path.relpath(call.args[0], temp_dir)
+            for call in scan.call_args_list
+        }
+        assert listed == {".", "sub"}
+
+    def test_pattern_with_directories_relative_root(self, temp_dir, monkeypatch):
+        """A '/' pattern should also match when the directory is '.'."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        f = temp_dir / "sub" / "a.log"
+        f.parent.mkdir()
+        f.write_text("content")
+        os.utime(f, (old_time, old_time))
+        monkeypatch.chdir(temp_dir)
+
+        stats = manage_files(".", days=5, pattern="sub/*.log")
+
+        assert stats.files_compressed == 1
+        assert (temp_dir / "sub" / "a.log.gz").exists()
+
     def test_min_size_filter(self, temp_dir):
         """Should skip files smaller than min_size."""
         old_time = time.time() - (10 * 24 * 60 * 60)
@@ -353,6 +668,248 @@ class TestManageFiles:
         assert small.exists()
         assert (temp_dir / "big.log.gz").exists()
 
+    def test_bundle_small_files(self, temp_dir):
+        """Small files from the same day should be archived together."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        names = ["a.log", "b.log", "c.log"]
+        for name in names:
+            f = temp_dir / name
+            f.write_text(f"content of {name}")
+            os.utime(f, (old_time, old_time))
+        big = temp_dir / "big.log"
+        big.write_text("x" * 5000)
+        os.utime(big, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5, bundle_below=1024)
+
+        day = time.strftime("%Y%m%d", time.localtime(old_time))
+        archive = temp_dir / f"logs-{day}.tar.gz"
+        assert stats.files_compressed == 4
+        assert not stats.errors
+        assert not any((temp_dir / name).exists() for name in names)
+        assert (temp_dir / "big.log.gz").exists()
+        with tarfile.open(archive, "r:gz") as tar:
+            assert sorted(tar.getnames()) == names
+            assert tar.extractfile("b.log").read() == b"content of b.log"
+
+    def test_bundle_files_dated_before_epoch(self, temp_dir):
+        """Members older than the gzip header's range should still bundle."""
+        old_time = -864000
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text(f"content of {name}")
+            os.utime(f, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5, bundle_below=1024)
+
+        assert stats.files_compressed == 2
+        assert not stats.errors
+        (archive,) = temp_dir.iterdir()
+        assert archive.stat().st_mtime == old_time
+
+    def test_bundle_does_not_overwrite_existing_archive(self, temp_dir):
+        """A second bundle for the same day should get a new name."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        day = time.strftime("%Y%m%d", time.localtime(old_time))
+        existing = temp_dir / f"logs-{day}.tar.gz"
+        existing.write_bytes(b"earlier archive")
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text("content")
+            os.utime(f, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5, bundle_below=1024)
+
+        assert stats.files_compressed == 2
+        assert existing.read_bytes() == b"earlier archive"
+        assert (temp_dir / f"logs-{day}-1.tar.gz").exists()
+
+    def test_bundle_keeps_most_restrictive_mode(self, temp_dir):
+        """The archive should be no more readable than its members."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        for name, mode in (("auth.log", 0o600), ("app.log", 0o640)):
+            f = temp_dir / name
+            f.write_text("secret")
+            os.chmod(f, mode)
+            os.utime(f, (old_time, old_time))
+
+        manage_files(temp_dir, days=5, bundle_below=1024)
+
+        (archive,) = temp_dir.glob("logs-*.tar.gz")
+        assert (archive.stat().st_mode & 0o777) == 0o600
+
+    def test_bundle_discarded_when_no_member_removed(self, temp_dir):
+        """If every member changed mid-bundle, no archive should remain."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        members = []
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text("content")
+            os.utime(f, (old_time, old_time))
+            members.append(f)
+
+        real_add = tarfile.TarFile.add
+
+        def add_then_modify(self, name, *args, **kwargs):
+            real_add(self, name, *args, **kwargs)
+            with open(name, "a") as f:
+                f.write("appended by another writer")
+
+        with patch.object(tarfile.TarFile, "add", add_then_modify):
+            stats = manage_files(temp_dir, days=5, bundle_below=1024)
+
+        assert stats.files_in_use == 2
+        assert stats.files_compressed == 0
+        assert all(f.exists() for f in members)
+        assert not list(temp_dir.glob("logs-*.tar.gz"))
+
+    def test_bundle_of_one_compressed_individually(self, temp_dir, old_file):
+        """A lone small file should get a plain .gz, not an archive."""
+        stats = manage_files(temp_dir, days=5, bundle_below=1024)
+
+        assert stats.files_compressed == 1
+        assert old_file.with_suffix(".log.gz").exists()
+        assert not list(temp_dir.glob("logs-*.tar.gz"))
+
+    def test_bundle_ignores_min_size(self, temp_dir):
+        """Files under min_size should still be bundled, unless alone."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text(f"content of {name}")
+            os.utime(f, (old_time, old_time))
+        lone = temp_dir / "sub" / "lone.log"
+        lone.parent.mkdir()
+        lone.write_text("hi")
+        os.utime(lone, (old_time, old_time))
+
+        stats = manage_files(
+            temp_dir, days=5, recursive=True, min_size=1024, bundle_below=512
+        )
+
+        assert stats.files_compressed == 2
+        assert stats.files_skipped == 1
+        assert len(list(temp_dir.glob("logs-*.tar.gz"))) == 1
+        assert not (temp_dir / "a.log").exists()
+        assert lone.exists()
+
+    def test_skip_fs_compressed_files(self, temp_dir):
+        """Should skip files occupying far fewer blocks than their size."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        # A sparse file looks exactly like a transparently compressed one.
+        sparse = temp_dir / "sparse.log"
+        with open(sparse, "wb") as f:
+            f.truncate(1 << 20)
+        os.utime(sparse, (old_time, old_time))
+        if sparse.stat().st_blocks * 512 >= (1 << 20):
+            pytest.skip("filesystem does not support sparse files")
+
+        stats = manage_files(temp_dir, days=5)
+        assert stats.files_skipped == 1
+        assert sparse.exists()
+
+        stats = manage_files(temp_dir, days=5, force=True)
+        assert stats.files_compressed == 1
+        assert (temp_dir / "sparse.log.gz").exists()
+
+    def test_dedupe_links_identical_files(self, temp_dir):
+        """Identical files should share one compressed inode."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        content = "duplicated log line\n" * 200
+        for name, text in (
+            ("a.log", content),
+            ("b.log", content),
+            ("c.log", content.replace("log", "LOG")),  # same size, different
+        ):
+            f = temp_dir / name
+            f.write_text(text)
+            os.utime(f, (old_time, old_time))
+
+        with patch(
+            "file_manager.compress_file", wraps=file_manager.compress_file
+        ) as compress:
+            stats = manage_files(temp_dir, days=5, dedupe=True)
+
+        assert compress.call_count == 2
+        assert stats.files_compressed == 3
+        assert not stats.errors
+        a_gz, b_gz, c_gz = (temp_dir / f"{n}.log.gz" for n in "abc")
+        assert a_gz.stat().st_ino == b_gz.stat().st_ino
+        assert c_gz.stat().st_ino != a_gz.stat().st_ino
+        for gz in (a_gz, b_gz):
+            with gzip.open(gz, "rt") as f:
+                assert f.read() == content
+        assert not any((temp_dir / f"{n}.log").exists() for n in "abc")
+
+    def test_dedupe_falls_back_when_link_fails(self, temp_dir):
+        """If hard-linking fails, the duplicate should be compressed itself."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        content = "duplicated log line\n" * 200
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text(content)
+            os.utime(f, (old_time, old_time))
+
+        with patch(
+            "file_manager.os.link",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            stats = manage_files(temp_dir, days=5, dedupe=True)
+
+        assert stats.files_compressed == 2
+        assert not stats.errors
+        a_gz, b_gz = temp_dir / "a.log.gz", temp_dir / "b.log.gz"
+        assert a_gz.stat().st_ino != b_gz.stat().st_ino
+        with gzip.open(b_gz, "rt") as f:
+            assert f.read() == content
+        assert not (temp_dir / "b.log").exists()
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "a.log.gz",
+            "b.log.gz",
+        ]
+
+    def test_dedupe_original_modified_after_scan(self, temp_dir):
+        """A duplicate must not be linked to an original that changed since."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        content = "duplicated log line\n" * 200
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text(content)
+            os.utime(f, (old_time, old_time))
+
+        real_digest = file_manager._file_digest
+
+        def digest_then_append(file_path):
+            digest = real_digest(file_path)
+            if file_path.name == "a.log":
+                with open(file_path, "a") as f:
+                    f.write("NEW DATA\n")
+            return digest
+
+        with patch("file_manager._file_digest", side_effect=digest_then_append):
+            stats = manage_files(temp_dir, days=5, dedupe=True)
+
+        assert stats.files_compressed == 2
+        a_gz, b_gz = temp_dir / "a.log.gz", temp_dir / "b.log.gz"
+        assert a_gz.stat().st_ino != b_gz.stat().st_ino
+        with gzip.open(a_gz, "rt") as f:
+            assert f.read() == content + "NEW DATA\n"
+        with gzip.open(b_gz, "rt") as f:
+            assert f.read() == content
+
+    def test_dedupe_dry_run(self, temp_dir):
+        """Dry-run dedupe should not create links or remove files."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        for name in ("a.log", "b.log"):
+            f = temp_dir / name
+            f.write_text("same content")
+            os.utime(f, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5, dedupe=True, dry_run=True)
+
+        assert stats.files_compressed == 2
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["a.log", "b.log"]
+
     def test_in_use_counted_separately(self, temp_dir, old_file):
         """A file modified mid-compression should count as in_use, not failed."""
         with patch(
@@ -366,6 +923,79 @@ class TestManageFiles:
         assert stats.files_compressed == 0
         assert not stats.errors
 
+    def test_parallel_jobs(self, temp_dir):
+        """Should compress every eligible file when using a process pool."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        content = "Parallel content " * 100
+        for i in range(20):
+            f = temp_dir / f"app{i}.log"
+            f.write_text(content)
+            os.utime(f, (old_time, old_time))
+
+        stats = manage_files(temp_dir, days=5, jobs=2)
+
+        assert stats.files_scanned == 20
+        assert stats.files_compressed == 20
+        assert stats.bytes_saved > 0
+        assert not stats.errors
+        for i in range(20):
+            with gzip.open(temp_dir / f"app{i}.log.gz", "rt") as f:
+                assert f.read() == content
+
+    def test_compresses_in_inode_order(self, temp_dir):
+        """Eligible files should be compressed in inode order."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        for name in ("c.log", "a.log", "d.log", "b.log"):
+            f = temp_dir / name
+            f.write_text("content")
+            os.utime(f, (old_time, old_time))
+        inodes = {p: p.stat().st_ino for p in temp_dir.iterdir()}
+
+        seen = []
+
+        def record(file_path, *args, **kwargs):
+            seen.append(file_path)
+            return CompressResult.SUCCESS, 0
+
+        with patch("file_manager.compress_file", side_effect=record):
+            manage_files(temp_dir, days=5)
+
+        assert seen == sorted(inodes, key=inodes.get)
+
+    def test_parallel_jobs_log_without_fork(self, temp_dir, caplog):
+        """Spawned workers should still log through the parent's handlers."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        for i in range(3):
+            f = temp_dir / f"app{i}.log"
+            f.write_text("Parallel content " * 100)
+            os.utime(f, (old_time, old_time))
+
+        with patch(
+            "file_manager.multiprocessing.get_all_start_methods",
+            return_value=["spawn"],
+        ), caplog.at_level(logging.INFO):
+            stats = manage_files(temp_dir, days=5, jobs=2)
+
+        assert stats.files_compressed == 3
+        assert caplog.text.count("Compressed:") == 3
+
+    def test_zero_days_skips_future_mtime(self, temp_dir):
+        """With days=0, past files are due but future-dated ones are not."""
+        past = temp_dir / "past.log"
+        past.write_text("content")
+        old_time = time.time() - 1
+        os.utime(past, (old_time, old_time))
+        future = temp_dir / "future.log"
+        future.write_text("content")
+        future_time = time.time() + 3600
+        os.utime(future, (future_time, future_time))
+
+        stats = manage_files(temp_dir, days=0)
+
+        assert stats.files_compressed == 1
+        assert stats.files_skipped == 1
+        assert future.exists()
+
     def test_custom_days_threshold(self, temp_dir):
         """Should respect custom days threshold."""
         file_path = temp_dir / "test.log"
@@ -410,6 +1040,24 @@ class TestSetupLogging:
         assert log_file.exists()
 
 
+class TestAvailableCpus:
+    """Tests for available_cpus function."""
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_getaffinity"), reason="needs sched_getaffinity"
+    )
+    def test_honours_affinity(self):
+        """Should count only the CPUs in the affinity mask."""
+        with patch("os.sched_getaffinity", return_value={0, 1}):
+            assert available_cpus() == 2
+
+    def test_falls_back_to_cpu_count(self, monkeypatch):
+        """Without affinity support, should fall back to cpu_count."""
+        monkeypatch.delattr(os, "sched_getaffinity", raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: None)
+        assert available_cpus() == 1
+
+
 class TestNonNegativeInt:
     """Tests for the non_negative_int argparse type."""
 
@@ -429,6 +1077,21 @@ class TestNonNegativeInt:
             non_negative_int("abc")
 
 
+class TestPositiveInt:
+    """Tests for the positive_int argparse type."""
+
+    def test_accepts_positive(self):
+        """Should accept positive integers."""
+        assert positive_int("1") == 1
+        assert positive_int("8") == 8
+
+    @pytest.mark.parametrize("value", ["0", "-1", "abc"])
+    def test_rejects_invalid(self, value):
+        """Should reject zero, negative, and non-integer values."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+
 class TestCompressionLevel:
     """Tests for the compression_level argparse type."""
 
@@ -449,6 +1112,20 @@ class TestCompressionLevel:
             compression_level("abc")
 
 
+class TestBackendLevel:
+    """Tests for backend_level function."""
+
+    def test_isal_levels_spread_over_four(self):
+        """gzip's 1-9 should map onto ISA-L's 0-3."""
+        levels = [backend_level("isal", level) for level in range(1, 10)]
+        assert levels == [0, 0, 1, 1, 2, 2, 3, 3, 3]
+
+    @pytest.mark.parametrize("compressor", ["stdlib", "zlibng"])
+    def test_other_backends_unchanged(self, compressor):
+        """Other backends should run at the requested level."""
+        assert [backend_level(compressor, n) for n in (1, 6, 9)] == [1, 6, 9]
+
+
 class TestHumanSize:
     """Tests for the human_size argparse type."""
 